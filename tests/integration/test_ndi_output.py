@@ -6,14 +6,29 @@ Tests actual NDI stream format, framerate, and progressive/interlaced mode.
 
 import subprocess
 import time
+import codecs
+import contextlib
+import io
 import json
-import requests
+import multiprocessing
 import sys
 import os
+import random
 import re
+import shutil
+import signal
+import socket
+import threading
+import urllib3
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Tuple, Optional
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; stdlib json accepts bytes too
+    json_loads = json.loads
+
 # ANSI color codes
 RED = '\033[0;31m'
 GREEN = '\033[0;32m'
@@ -24,6 +39,55 @@ NC = '\033[0m'  # No Color
 SCRIPT_DIR = Path(__file__).parent.resolve()
 PROJECT_ROOT = SCRIPT_DIR.parent.parent
 WORKER_BIN = PROJECT_ROOT / "build" / "bin" / "html2ndi.app" / "Contents" / "MacOS" / "html2ndi"
+WORKER_BIN_STR = str(WORKER_BIN)
+
+# Worker HTTP API address (a literal IP skips name resolution on every poll)
+WORKER_HOST = "127.0.0.1"
+
+# External tool availability (resolved once, in-process)
+HAS_FFMPEG = shutil.which('ffmpeg') is not None
+HAS_GSTREAMER = shutil.which('gst-launch-1.0') is not None
+HAS_JQ = shutil.which('jq') is not None
+
+# ffmpeg stream info: resolution, framerate and scan type in a single pass
+FFMPEG_INFO_RE = re.compile(
+    r'(?P<resolution>(?P<width>\d+)x(?P<height>\d+))'
+    r'|(?P<fps>\d+(?:\.\d+)?)\s+fps'
+    r'|(?P<scan_type>(?i:progressive|interlaced))'
+)
+FFMPEG_INFO_FIELDS = ('resolution', 'fps', 'scan_type')
+FFMPEG_TIMEOUT = 15.0
+
+# Shared connection pool so polls reuse keep-alive connections to the workers
+HTTP = urllib3.PoolManager(num_pools=4, maxsize=32, retries=False,
+                           timeout=urllib3.Timeout(connect=0.5, read=1.0))
+
+# Worker startup polling (exponential backoff with jitter)
+STARTUP_TIMEOUT = 30.0
+BACKOFF_BASE = 0.05
+BACKOFF_CAP = 2.0
+BACKOFF_JITTER = 0.2
+
+# Worker startup circuit breaker
+BREAKER_FAILURE_THRESHOLD = 2
+BREAKER_RECOVERY_TIMEOUT = 60.0
+
+# Worker shutdown: SIGTERM grace period before escalating to SIGKILL
+STOP_GRACE_PERIOD = 5.0
+REAPER_POLL_INTERVAL = 0.05
+
+# NDI stream stabilization (worst case matches the old fixed 3s sleep)
+STREAM_READY_TIMEOUT = 3.0
+STREAM_READY_POLL_CAP = 0.5
+
+# Test cases: (name, width, height, fps, progressive)
+TEST_CASES = [
+    ("1080p60 Progressive", 1920, 1080, 60, True),
+    ("720p50 Progressive", 1280, 720, 50, True),
+    ("1080i30 Interlaced", 1920, 1080, 30, False),
+    ("4K UHD 30p Progressive", 3840, 2160, 30, True),
+    ("720p24 Progressive", 1280, 720, 24, True),
+]
 
 # Test statistics
 tests_run = 0
@@ -33,21 +97,145 @@ tests_failed = 0
 # Worker process
 worker_process = None
 
+# Terminated workers awaiting reaping: [process, kill deadline, cache path]
+ZOMBIES = []
+zombies_lock = threading.Lock()
+reaper_thread = None
+
+
+class WorkerCircuitBreaker:
+    """Fail fast once the worker has repeatedly failed to start.
+    
+    State lives in shared memory so every test process in the pool sees it.
+    After the recovery timeout a single startup attempt is let through
+    (half-open); its outcome closes or re-opens the breaker.
+    """
+    
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
+    
+    def __init__(self, failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+                 recovery_timeout: float = BREAKER_RECOVERY_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._lock = multiprocessing.Lock()
+        self._state = multiprocessing.RawValue('i', self.CLOSED)
+        self._failures = multiprocessing.RawValue('i', 0)
+        self._opened_at = multiprocessing.RawValue('d', 0.0)
+    
+    @property
+    def state(self) -> int:
+        return self._state.value
+    
+    def allow_request(self) -> bool:
+        """Return True if a worker startup may be attempted."""
+        with self._lock:
+            if self._state.value == self.CLOSED:
+                return True
+            if (self._state.value == self.OPEN and
+                    time.monotonic() - self._opened_at.value >= self.recovery_timeout):
+                self._state.value = self.HALF_OPEN
+                return True
+            return False
+    
+    def record_success(self):
+        with self._lock:
+            self._state.value = self.CLOSED
+            self._failures.value = 0
+    
+    def record_failure(self):
+        with self._lock:
+            self._failures.value += 1
+            if (self._state.value == self.HALF_OPEN or
+                    self._failures.value >= self.failure_threshold):
+                self._state.value = self.OPEN
+                self._opened_at.value = time.monotonic()
+
+
+# Set per pool process by init_test_process; created in main() so that importing
+# this module allocates no multiprocessing primitives.
+worker_breaker = None
+
+# Pool process state: a test case is running / Ctrl-C has been received
+test_running = False
+interrupted = False
+
 
 def print_color(message: str, color: str = NC):
     """Print colored message."""
     print(f"{color}{message}{NC}")
 
 
+def backoff_delay(attempt: int, cap: float = BACKOFF_CAP) -> float:
+    """Return the jittered exponential backoff delay for a poll attempt."""
+    delay = min(cap, BACKOFF_BASE * 2 ** attempt)
+    return delay * (1 + random.uniform(-BACKOFF_JITTER, BACKOFF_JITTER))
+
+
+def deadline_after(seconds: float) -> int:
+    """Return a time.monotonic_ns() deadline the given number of seconds away."""
+    return time.monotonic_ns() + int(seconds * 1_000_000_000)
+
+
+def backoff_sleep(attempt: int, deadline_ns: int, cap: float = BACKOFF_CAP):
+    """Sleep for the backoff delay, without sleeping past deadline_ns."""
+    remaining = (deadline_ns - time.monotonic_ns()) / 1e9
+    time.sleep(max(0.0, min(backoff_delay(attempt, cap), remaining)))
+
+
+def parse_ffmpeg_output(output: str, info: Dict[str, object]) -> None:
+    """Record the first resolution, fps and scan type found in ffmpeg output."""
+    for match in FFMPEG_INFO_RE.finditer(output):
+        kind = match.lastgroup
+        if kind in info:
+            continue
+        if kind == 'resolution':
+            info['resolution'] = (int(match.group('width')), int(match.group('height')))
+        elif kind == 'fps':
+            info['fps'] = float(match.group('fps'))
+        else:
+            info['scan_type'] = match.group('scan_type').lower()
+
+
+def capture_ffmpeg_info(ndi_name: str, timeout: float = FFMPEG_TIMEOUT) -> Dict[str, object]:
+    """Read ffmpeg's stderr until the stream info is known, then stop ffmpeg."""
+    cmd = ['ffmpeg', '-f', 'libndi_newtek', '-i', ndi_name, '-t', '2', '-f', 'null', '-']
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                            text=True, bufsize=1)
+    
+    timed_out = threading.Event()
+    
+    def expire():
+        timed_out.set()
+        proc.kill()
+    
+    timer = threading.Timer(timeout, expire)
+    timer.start()
+    info = {}
+    try:
+        for line in proc.stderr:
+            parse_ffmpeg_output(line, info)
+            if len(info) == len(FFMPEG_INFO_FIELDS):
+                # Headers are all we need; don't wait for the full capture
+                proc.terminate()
+                break
+    finally:
+        proc.stderr.close()
+        proc.wait()
+        timer.cancel()
+    
+    if timed_out.is_set() and len(info) < len(FFMPEG_INFO_FIELDS):
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return info
+
+
 def check_prerequisites() -> bool:
     """Check if required tools are installed."""
     print("Checking prerequisites...")
     
     # Check for ffmpeg or gstreamer
-    has_ffmpeg = subprocess.run(['which', 'ffmpeg'], capture_output=True).returncode == 0
-    has_gstreamer = subprocess.run(['which', 'gst-launch-1.0'], capture_output=True).returncode == 0
-    
-    if not has_ffmpeg and not has_gstreamer:
+    if not HAS_FFMPEG and not HAS_GSTREAMER:
         print_color("ERROR: Neither ffmpeg nor gstreamer found", RED)
         print("Install one of:")
         print("  1. ffmpeg with NDI: brew install homebrew-ffmpeg/ffmpeg/ffmpeg --with-libndi_newtek")
@@ -61,7 +249,7 @@ def check_prerequisites() -> bool:
         return False
     
     # Check for jq
-    if subprocess.run(['which', 'jq'], capture_output=True).returncode != 0:
+    if not HAS_JQ:
         print_color("WARNING: jq not found, install for better JSON parsing", YELLOW)
     
     print_color("✓ Prerequisites OK", GREEN)
@@ -69,66 +257,137 @@ def check_prerequisites() -> bool:
 
 
 def start_worker(url: str, width: int, height: int, fps: int, 
-                progressive: bool, ndi_name: str, http_port: int) -> Optional[subprocess.Popen]:
+                progressive: bool, ndi_name: str, http_port: int,
+                cache_path: str, log_path: str) -> Optional[subprocess.Popen]:
     """Start html2ndi worker process."""
     global worker_process
     
     print(f"Starting worker: {width}x{height}@{fps}fps {'progressive' if progressive else 'interlaced'}")
     
     cmd = [
-        str(WORKER_BIN),
+        WORKER_BIN_STR,
         "--url", url,
         "--width", str(width),
         "--height", str(height),
         "--fps", str(fps),
         "--ndi-name", ndi_name,
         "--http-port", str(http_port),
-        "--cache-path", f"/tmp/html2ndi-test-{os.getpid()}"
+        "--cache-path", cache_path
     ]
     
     if not progressive:
         cmd.append("--interlaced")
     
-    log_file = open(f"/tmp/html2ndi-worker-{os.getpid()}.log", "w")
-    worker_process = subprocess.Popen(cmd, stdout=log_file, stderr=subprocess.STDOUT)
-    
-    print(f"Worker PID: {worker_process.pid}")
-    
-    # Wait for worker to start
-    print("Waiting for worker to initialize...")
-    for i in range(30):
-        try:
-            response = requests.get(f"http://localhost:{http_port}/status", timeout=1)
-            if response.status_code == 200:
-                print_color("✓ Worker started", GREEN)
-                return worker_process
-        except requests.exceptions.RequestException:
-            pass
-        time.sleep(1)
-    
-    print_color("ERROR: Worker failed to start", RED)
-    log_file.close()
-    with open(f"/tmp/html2ndi-worker-{os.getpid()}.log", "r") as f:
-        print(f.read())
+    # Append mode keeps the worker's writes at the end of the log even when we
+    # seek back to dump it, since both share the same file offset.
+    with open(log_path, "a+b") as log_file:
+        log_file.truncate(0)
+        # Keep the default close_fds=True: under the spawn start method the pool
+        # process's IPC fds are inheritable and must not leak into the worker.
+        worker_process = subprocess.Popen(cmd, stdout=log_file, stderr=subprocess.STDOUT)
+        
+        print(f"Worker PID: {worker_process.pid}")
+        
+        # Wait for worker to start
+        print("Waiting for worker to initialize...")
+        deadline_ns = deadline_after(STARTUP_TIMEOUT)
+        attempt = 0
+        while time.monotonic_ns() < deadline_ns:
+            # Another test case's startup failures opened the breaker; stop waiting
+            if worker_breaker.state == WorkerCircuitBreaker.OPEN:
+                print_color("ERROR: Worker startup aborted (circuit breaker open)", RED)
+                return None
+            # A crashed worker will never answer; fail now rather than at the deadline
+            if worker_process.poll() is not None:
+                print_color(f"ERROR: Worker exited during startup (code {worker_process.returncode})", RED)
+                break
+            try:
+                # A bare TCP connect fails fast until the HTTP server is listening;
+                # only then confirm with a single HTTP probe.
+                with socket.create_connection((WORKER_HOST, http_port), timeout=0.1):
+                    pass
+                response = HTTP.request('GET', f"http://{WORKER_HOST}:{http_port}/status", timeout=1.0)
+                if response.status == 200:
+                    print_color("✓ Worker started", GREEN)
+                    return worker_process
+            except (OSError, urllib3.exceptions.HTTPError):
+                pass
+            backoff_sleep(attempt, deadline_ns)
+            attempt += 1
+        
+        print_color("ERROR: Worker failed to start", RED)
+        log_file.seek(0)
+        # Decode while copying so the log also lands in a captured stdout
+        shutil.copyfileobj(codecs.getreader("utf-8")(log_file, errors="replace"), sys.stdout)
     return None
 
 
-def stop_worker():
-    """Stop worker process."""
-    global worker_process
-    
-    if worker_process:
-        print(f"Stopping worker (PID: {worker_process.pid})...")
-        worker_process.terminate()
+def wait_for_stream(http_port: int, timeout: float = STREAM_READY_TIMEOUT) -> bool:
+    """Wait until the worker reports sent NDI frames, up to timeout seconds."""
+    deadline_ns = deadline_after(timeout)
+    attempt = 0
+    while time.monotonic_ns() < deadline_ns:
         try:
-            worker_process.wait(timeout=5)
-        except subprocess.TimeoutExpired:
-            worker_process.kill()
-            worker_process.wait()
-        worker_process = None
-    
-    # Cleanup
-    subprocess.run(['rm', '-rf', f"/tmp/html2ndi-test-{os.getpid()}"], capture_output=True)
+            response = HTTP.request('GET', f"http://{WORKER_HOST}:{http_port}/status", timeout=0.5)
+            if json_loads(response.data).get('frames', {}).get('sent', 0) > 0:
+                return True
+        except (urllib3.exceptions.HTTPError, ValueError):
+            pass
+        backoff_sleep(attempt, deadline_ns, cap=STREAM_READY_POLL_CAP)
+        attempt += 1
+    return False
+
+
+def reap_zombies():
+    """Reap terminated workers, escalating to SIGKILL past their deadline."""
+    global reaper_thread
+    
+    while True:
+        with zombies_lock:
+            now = time.monotonic()
+            for entry in list(ZOMBIES):
+                process, deadline, cache_path = entry
+                if process.poll() is not None:
+                    ZOMBIES.remove(entry)
+                    shutil.rmtree(cache_path, ignore_errors=True)
+                elif now >= deadline:
+                    process.kill()
+                    entry[1] = float('inf')
+            if not ZOMBIES:
+                reaper_thread = None
+                return
+        time.sleep(REAPER_POLL_INTERVAL)
+
+
+def stop_worker(cache_path: str):
+    """Stop worker process without waiting for it to exit."""
+    global worker_process, reaper_thread
+    
+    if not worker_process:
+        shutil.rmtree(cache_path, ignore_errors=True)
+        return
+    
+    print(f"Stopping worker (PID: {worker_process.pid})...")
+    worker_process.terminate()
+    
+    # The reaper removes the cache once the worker has actually exited. It is
+    # not a daemon thread, so a pool process still waits for it before exiting.
+    with zombies_lock:
+        ZOMBIES.append([worker_process, time.monotonic() + STOP_GRACE_PERIOD, cache_path])
+        if reaper_thread is None:
+            reaper_thread = threading.Thread(target=reap_zombies, name="worker-reaper")
+            reaper_thread.start()
+    worker_process = None
+
+
+def check_fields(checks) -> bool:
+    """Report each failed (label, expected, actual, ok) check; True if all passed."""
+    passed = True
+    for label, expected, actual, ok in checks:
+        if not ok:
+            print_color(f"✗ {label} mismatch: expected {expected}, got {actual}", RED)
+            passed = False
+    return passed
 
 
 def verify_stream_via_api(http_port: int, expected_width: int, expected_height: int,
@@ -137,8 +396,8 @@ def verify_stream_via_api(http_port: int, expected_width: int, expected_height:
     print("Verifying stream via HTTP API...")
     
     try:
-        response = requests.get(f"http://localhost:{http_port}/status")
-        data = response.json()
+        response = HTTP.request('GET', f"http://{WORKER_HOST}:{http_port}/status")
+        data = json_loads(response.data)
         
         actual_width = data['width']
         actual_height = data['height']
@@ -147,25 +406,13 @@ def verify_stream_via_api(http_port: int, expected_width: int, expected_height:
         
         print(f"API reports: {actual_width}x{actual_height} @ {actual_fps}fps progressive={actual_progressive}")
         
-        passed = True
-        
-        if actual_width != expected_width:
-            print_color(f"✗ Width mismatch: expected {expected_width}, got {actual_width}", RED)
-            passed = False
-        
-        if actual_height != expected_height:
-            print_color(f"✗ Height mismatch: expected {expected_height}, got {actual_height}", RED)
-            passed = False
-        
-        if actual_fps != expected_fps:
-            print_color(f"✗ FPS mismatch: expected {expected_fps}, got {actual_fps}", RED)
-            passed = False
-        
-        if actual_progressive != expected_progressive:
-            print_color(f"✗ Progressive mismatch: expected {expected_progressive}, got {actual_progressive}", RED)
-            passed = False
-        
-        return passed
+        return check_fields((
+            ("Width", expected_width, actual_width, actual_width == expected_width),
+            ("Height", expected_height, actual_height, actual_height == expected_height),
+            ("FPS", expected_fps, actual_fps, actual_fps == expected_fps),
+            ("Progressive", expected_progressive, actual_progressive,
+             actual_progressive == expected_progressive),
+        ))
     
     except Exception as e:
         print_color(f"✗ API verification failed: {e}", RED)
@@ -179,60 +426,33 @@ def verify_stream_with_ffmpeg(ndi_name: str, expected_width: int, expected_heigh
     
     try:
         # Capture stream metadata
-        result = subprocess.run(
-            ['ffmpeg', '-f', 'libndi_newtek', '-i', ndi_name, '-t', '2', '-f', 'null', '-'],
-            capture_output=True,
-            text=True,
-            timeout=15
-        )
-        
-        output = result.stderr
+        info = capture_ffmpeg_info(ndi_name)
         
         # Parse resolution
-        resolution_match = re.search(r'(\d+)x(\d+)', output)
-        if resolution_match:
-            actual_width = int(resolution_match.group(1))
-            actual_height = int(resolution_match.group(2))
+        if 'resolution' in info:
+            actual_width, actual_height = info['resolution']
         else:
             print_color("⚠ Could not parse resolution from ffmpeg output", YELLOW)
             return True  # Soft fail
         
-        # Parse framerate
-        fps_match = re.search(r'(\d+(?:\.\d+)?)\s+fps', output)
-        actual_fps = float(fps_match.group(1)) if fps_match else None
-        
-        # Parse scan type
-        scan_match = re.search(r'(progressive|interlaced)', output, re.IGNORECASE)
-        scan_type = scan_match.group(1).lower() if scan_match else None
+        # Parse framerate and scan type
+        actual_fps = info.get('fps')
+        scan_type = info.get('scan_type')
         
         print(f"Detected: {actual_width}x{actual_height} @ {actual_fps}fps")
         if scan_type:
             print(f"Scan type: {scan_type}")
         
-        # Validate
-        passed = True
-        
-        if actual_width != expected_width:
-            print_color(f"✗ Width mismatch: expected {expected_width}, got {actual_width}", RED)
-            passed = False
-        
-        if actual_height != expected_height:
-            print_color(f"✗ Height mismatch: expected {expected_height}, got {actual_height}", RED)
-            passed = False
-        
-        if actual_fps and abs(actual_fps - expected_fps) > 1:
-            print_color(f"✗ FPS mismatch: expected {expected_fps}, got {actual_fps}", RED)
-            passed = False
-        
-        if scan_type:
-            if expected_progressive and scan_type == 'interlaced':
-                print_color(f"✗ Scan mode mismatch: expected progressive, got interlaced", RED)
-                passed = False
-            elif not expected_progressive and scan_type == 'progressive':
-                print_color(f"✗ Scan mode mismatch: expected interlaced, got progressive", RED)
-                passed = False
-        
-        return passed
+        # Validate (fps and scan type are only checked when ffmpeg reported them)
+        expected_scan = 'progressive' if expected_progressive else 'interlaced'
+        return check_fields((
+            ("Width", expected_width, actual_width, actual_width == expected_width),
+            ("Height", expected_height, actual_height, actual_height == expected_height),
+            ("FPS", expected_fps, actual_fps,
+             not actual_fps or abs(actual_fps - expected_fps) <= 1),
+            ("Scan mode", expected_scan, scan_type,
+             not scan_type or scan_type == expected_scan),
+        ))
     
     except subprocess.TimeoutExpired:
         print_color("⚠ ffmpeg timeout (may not have NDI support)", YELLOW)
@@ -242,55 +462,103 @@ def verify_stream_with_ffmpeg(ndi_name: str, expected_width: int, expected_heigh
         return True  # Soft fail
 
 
-def run_test(test_name: str, width: int, height: int, fps: int, progressive: bool) -> bool:
-    """Run a single test case."""
-    global tests_run, tests_passed, tests_failed
+def handle_sigint(signum, frame):
+    """Pool process SIGINT handler: abort the running test, skip queued ones."""
+    global interrupted
+    interrupted = True
+    # Raising while idle would kill the pool process and break the executor
+    if test_running:
+        raise KeyboardInterrupt
+
+
+def init_test_process(breaker: WorkerCircuitBreaker):
+    """Process pool initializer: share the parent's circuit breaker."""
+    global worker_breaker
+    worker_breaker = breaker
+    signal.signal(signal.SIGINT, handle_sigint)
+
+
+def run_test(test_index: int, test_name: str, width: int, height: int,
+             fps: int, progressive: bool) -> Tuple[str, bool, str]:
+    """Pool entry point: run a test case, returning (name, passed, output).
     
-    tests_run += 1
+    Output is captured rather than printed so that concurrent test cases
+    don't interleave; the parent prints each block in test order.
+    """
+    global test_running
     
+    # Test cases already handed to this process still arrive after Ctrl-C
+    if interrupted:
+        return test_name, False, ""
+    
+    output = io.StringIO()
+    test_running = True
+    try:
+        with contextlib.redirect_stdout(output):
+            passed = run_test_case(test_index, test_name, width, height, fps, progressive)
+    finally:
+        test_running = False
+    return test_name, passed, output.getvalue()
+
+
+def run_test_case(test_index: int, test_name: str, width: int, height: int,
+                  fps: int, progressive: bool) -> bool:
+    """Run a single test case in isolation and return whether it passed."""
     print("\n" + "=" * 40)
-    print(f"Test {tests_run}: {test_name}")
+    print(f"Test {test_index}: {test_name}")
     print("=" * 40)
     
-    ndi_name = f"HTML2NDI-Test-{tests_run}"
-    http_port = 8080 + tests_run
+    ndi_name = f"HTML2NDI-Test-{test_index}"
+    http_port = 8080 + test_index
+    cache_path = f"/tmp/html2ndi-test-{os.getpid()}-{test_index}"
+    log_path = f"/tmp/html2ndi-worker-{os.getpid()}-{test_index}.log"
     
-    # Start worker
-    if not start_worker("about:blank", width, height, fps, progressive, ndi_name, http_port):
-        print_color(f"✗ Test failed: Worker startup failed", RED)
-        tests_failed += 1
+    if not worker_breaker.allow_request():
+        print_color("✗ Test failed: Worker startup skipped (circuit breaker open)", RED)
         return False
     
-    # Wait for NDI stream to stabilize
-    time.sleep(3)
-    
-    test_passed = True
-    
-    # Verify via HTTP API
-    if not verify_stream_via_api(http_port, width, height, fps, progressive):
-        test_passed = False
-    
-    # Try to verify with ffmpeg if available
-    if subprocess.run(['which', 'ffmpeg'], capture_output=True).returncode == 0:
-        if not verify_stream_with_ffmpeg(ndi_name, width, height, fps, progressive):
-            # ffmpeg verification is optional, don't fail test
-            pass
-    
-    # Stop worker
-    stop_worker()
+    try:
+        # Start worker
+        if not start_worker("about:blank", width, height, fps, progressive, ndi_name, http_port,
+                            cache_path, log_path):
+            # An aborted startup is not a failure of its own; don't extend the open window
+            if worker_breaker.state != WorkerCircuitBreaker.OPEN:
+                worker_breaker.record_failure()
+            print_color(f"✗ Test failed: Worker startup failed", RED)
+            return False
+        worker_breaker.record_success()
+        
+        # Wait for NDI stream to stabilize
+        if not wait_for_stream(http_port):
+            print_color("⚠ No NDI frames reported yet, verifying anyway", YELLOW)
+        
+        # Verify via HTTP API and, if available, ffmpeg concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            api_check = executor.submit(verify_stream_via_api, http_port, width, height, fps, progressive)
+            ffmpeg_check = None
+            if HAS_FFMPEG:
+                ffmpeg_check = executor.submit(verify_stream_with_ffmpeg, ndi_name, width, height, fps, progressive)
+            
+            test_passed = api_check.result()
+            
+            if ffmpeg_check and not ffmpeg_check.result():
+                # ffmpeg verification is optional, don't fail test
+                pass
+    finally:
+        # Stop worker
+        stop_worker(cache_path)
     
     if test_passed:
         print_color(f"✓ Test passed: {test_name}", GREEN)
-        tests_passed += 1
-        return True
     else:
         print_color(f"✗ Test failed: {test_name}", RED)
-        tests_failed += 1
-        return False
+    return test_passed
 
 
 def main():
     """Main test suite."""
+    global tests_run, tests_passed, tests_failed
+    
     print("=" * 40)
     print("HTML2NDI End-to-End Integration Tests")
     print("=" * 40)
@@ -299,25 +567,25 @@ def main():
     if not check_prerequisites():
         sys.exit(1)
     
-    try:
-        # Test 1: 1080p60 (Progressive)
-        run_test("1080p60 Progressive", 1920, 1080, 60, True)
-        
-        # Test 2: 720p50 (Progressive)
-        run_test("720p50 Progressive", 1280, 720, 50, True)
-        
-        # Test 3: 1080i30 (Interlaced)
-        run_test("1080i30 Interlaced", 1920, 1080, 30, False)
-        
-        # Test 4: 4K30p (Progressive)
-        run_test("4K UHD 30p Progressive", 3840, 2160, 30, True)
-        
-        # Test 5: 720p24 (Film rate)
-        run_test("720p24 Progressive", 1280, 720, 24, True)
-        
-    finally:
-        # Ensure cleanup
-        stop_worker()
+    # Each test case uses its own HTTP port, NDI name, cache dir and log file,
+    # so they are independent and can run concurrently.
+    indices = range(1, len(TEST_CASES) + 1)
+    max_workers = min(len(TEST_CASES), os.cpu_count() or 1)
+    breaker = WorkerCircuitBreaker()
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=init_test_process,
+                             initargs=(breaker,)) as executor:
+        try:
+            for test_name, passed, output in executor.map(run_test, indices, *zip(*TEST_CASES)):
+                print(output, end="")
+                tests_run += 1
+                if passed:
+                    tests_passed += 1
+                else:
+                    tests_failed += 1
+        except BaseException:
+            # Don't start queued test cases after Ctrl-C or an error
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
     
     # Print summary
     print()
@@ -345,6 +613,5 @@ if __name__ == '__main__':
         main()
     except KeyboardInterrupt:
         print("\n\nInterrupted by user")
-        stop_worker()
         sys.exit(130)
 